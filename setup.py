@@ -43,6 +43,7 @@ TESTS_REQUIRE = [
     "flake8-docstrings",
     "flake8-isort",
     "mypy",
+    "numba",
     "pydocstyle",
     "pytest",
     "pytest-cov",
@@ -79,6 +80,8 @@ setup(
         # We'd like to specify `gym[mujoco]`, but this is a no-op when Gym is already
         # installed. See https://github.com/pypa/pip/issues/4957 for issue.
         "mujoco": ["mujoco_py>=1.50, <2.0", "imageio"],
+        # Optional: JIT-compiles the step kernels of tabular environments.
+        "numba": ["numba"],
     },
     url="https://github.com/HumanCompatibleAI/benchmark-environments",
     license="MIT",
@@ -9,6 +9,11 @@ import numpy as np
 
 from seals import util
 
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
 State = TypeVar("State")
 Observation = TypeVar("Observation")
 Action = TypeVar("Action")
@@ -37,9 +42,14 @@ class ResettablePOMDP(gym.Env, abc.ABC, Generic[State, Observation, Action]):
             observation_space: gym.Space containing possible observations.
             action_space: gym.Space containing possible actions.
         """
-        self._state_space = state_space
-        self._observation_space = observation_space
-        self._action_space = action_space
+        # Plain attributes rather than properties: wrappers and vector envs read
+        # `observation_space` and `action_space` on every step.
+        self.state_space = state_space
+        """State space. Often same as observation_space, but differs in POMDPs."""
+        self.observation_space = observation_space
+        """Observation space. Return type of reset() and component of step()."""
+        self.action_space = action_space
+        """Action space. Parameter type of step()."""
 
         self.cur_state: Optional[State] = None
         self._n_actions_taken: Optional[int] = None
@@ -57,6 +67,15 @@ class ResettablePOMDP(gym.Env, abc.ABC, Generic[State, Observation, Action]):
     def reward(self, state: State, action: Action, new_state: State) -> float:
         """Computes reward for a given transition."""
 
+    def transition_reward(self, state: State, action: Action) -> Tuple[State, float]:
+        """Samples next state and computes reward of the resulting transition.
+
+        Defaults to calling `transition` and then `reward`. Subclasses may override
+        this to compute both at once more efficiently.
+        """
+        new_state = self.transition(state, action)
+        return new_state, self.reward(state, action, new_state)
+
     @abc.abstractmethod
     def terminal(self, state: State, step: int) -> bool:
         """Is the state terminal?"""
@@ -65,21 +84,6 @@ class ResettablePOMDP(gym.Env, abc.ABC, Generic[State, Observation, Action]):
     def obs_from_state(self, state: State) -> Observation:
         """Sample observation for given state."""
 
-    @property
-    def state_space(self) -> gym.Space:
-        """State space. Often same as observation_space, but differs in POMDPs."""
-        return self._state_space
-
-    @property
-    def observation_space(self) -> gym.Space:
-        """Observation space. Return type of reset() and component of step()."""
-        return self._observation_space
-
-    @property
-    def action_space(self) -> gym.Space:
-        """Action space. Parameter type of step()."""
-        return self._action_space
-
     @property
     def n_actions_taken(self) -> int:
         """Number of steps taken so far."""
@@ -92,7 +96,7 @@ class ResettablePOMDP(gym.Env, abc.ABC, Generic[State, Observation, Action]):
             # Gym API wants list of seeds to be returned for some reason, so
             # generate a seed explicitly in this case
             seed = np.random.randint(0, 1 << 31)
-        self.rand_state = np.random.RandomState(seed)
+        self.rng = np.random.default_rng(seed)
         return [seed]
 
     def reset(self) -> Observation:
@@ -110,11 +114,10 @@ class ResettablePOMDP(gym.Env, abc.ABC, Generic[State, Observation, Action]):
             raise ValueError(f"{action} not in {self.action_space}")
 
         old_state = self.cur_state
-        self.cur_state = self.transition(self.cur_state, action)
+        self.cur_state, rew = self.transition_reward(self.cur_state, action)
         assert self.cur_state in self.state_space, f"unexpected state {self.cur_state}"
         obs = self.obs_from_state(self.cur_state)
         assert obs in self.observation_space, f"{obs} not in {self.observation_space}"
-        rew = self.reward(old_state, action, self.cur_state)
         done = self.terminal(self.cur_state, self._n_actions_taken)
         self._n_actions_taken += 1
 
@@ -150,6 +153,134 @@ class ResettableMDP(ResettablePOMDP[State, State, Action], Generic[State, Action
         return state
 
 
+def _check_tabular_model(
+    transition_matrix: np.ndarray,
+    reward_matrix: np.ndarray,
+    initial_state_dist: Optional[np.ndarray],
+) -> np.ndarray:
+    """Validates arguments to tabular environments.
+
+    Returns:
+        `initial_state_dist`, defaulting to a one-hot distribution on state 0 if
+        it is `None`.
+
+    Raises:
+        ValueError if the arguments have incompatible shapes.
+    """
+    n_states, n_actions, n_next_states = transition_matrix.shape
+    if n_states != n_next_states:
+        raise ValueError(
+            "Malformed transition_matrix:\n"
+            f"transition_matrix.shape: {transition_matrix.shape}\n"
+            f"{n_states} != {n_next_states}",
+        )
+
+    if initial_state_dist is None:
+        initial_state_dist = util.one_hot_encoding(0, n_states)
+    if initial_state_dist.ndim != 1:
+        raise ValueError(
+            "initial_state_dist has multiple dimensions:\n"
+            f"{initial_state_dist.ndim} != 1",
+        )
+    if initial_state_dist.shape[0] != n_states:
+        raise ValueError(
+            "transition_matrix and initial_state_dist are not compatible:\n"
+            f"n_states = {n_states}\n"
+            f"len(initial_state_dist) = {len(initial_state_dist)}",
+        )
+
+    if reward_matrix.shape != transition_matrix.shape[: len(reward_matrix.shape)]:
+        raise ValueError(
+            "transition_matrix and reward_matrix are not compatible:\n"
+            f"transition_matrix.shape: {transition_matrix.shape}\n"
+            f"reward_matrix.shape: {reward_matrix.shape}",
+        )
+
+    return initial_state_dist
+
+
+def _cdf(p: np.ndarray) -> np.ndarray:
+    """Cumulative sum of distributions `p` along the last axis, for sampling.
+
+    Stored as contiguous float32: single precision is ample for comparison against
+    uniform random numbers, and halves the memory read per sample. The final entry
+    is set to exactly 1, so rounding error can never leave a draw unmatched.
+    """
+    cdf = np.ascontiguousarray(np.cumsum(p, axis=-1), dtype=np.float32)
+    cdf[..., -1] = 1.0
+    return cdf
+
+
+def _sample_from_cdf_rows(
+    flat_cdf: np.ndarray,
+    n: int,
+    rows: np.ndarray,
+    r: np.ndarray,
+) -> np.ndarray:
+    """Samples an index from row `rows[j]` of a table of CDFs, for each `j`.
+
+    Args:
+        flat_cdf: Flattened `(m, n)` table of CDFs, with `i` added to row `i` so
+            that the whole table is sorted. A single `searchsorted` then samples
+            from every row at once, without gathering the rows.
+        n: Length of each CDF.
+        rows: Indices of the rows to sample from.
+        r: Uniform random numbers in `[0, 1)`, one per entry of `rows`.
+
+    Returns:
+        For each `j`, the smallest `i` with `r[j] < cdf[rows[j], i]`.
+    """
+    idx = np.searchsorted(flat_cdf, rows + r, side="right") - rows * n
+    return np.minimum(idx, n - 1)
+
+
+def _step_kernel(cdf: np.ndarray, rew: np.ndarray, state, action, r):
+    """Samples next state and looks up reward for a single tabular transition.
+
+    Args:
+        cdf: 3-D array of transition CDFs, indexed by `(state, action)`.
+        rew: 3-D array of rewards, indexed by `(state, action, next_state)`.
+        state: The current state.
+        action: The action taken.
+        r: Uniform random number in `[0, 1)` used to sample the next state.
+
+    Returns:
+        A tuple `(next_state, reward)`.
+    """
+    new_state = util.sample_from_cdf(cdf[state, action], r)
+    return new_state, rew[state, action, new_state]
+
+
+def _vec_step_kernel(cdf: np.ndarray, rew: np.ndarray, states, actions, r):
+    """Applies `_step_kernel` to each of a batch of environments."""
+    n = states.shape[0]
+    new_states = np.empty(n, dtype=np.int64)
+    rews = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        new_states[i], rews[i] = _step_kernel(cdf, rew, states[i], actions[i], r[i])
+    return new_states, rews
+
+
+if numba is not None:
+    # Not `parallel=True`: each transition is a single binary search, and Numba's
+    # thread pool makes the interpreter hang at exit once the process has forked
+    # (e.g. for `SubprocVecEnv` or `AsyncVectorEnv`).
+    _step_kernel = numba.njit(cache=True)(_step_kernel)
+    _vec_step_kernel = numba.njit(cache=True)(_vec_step_kernel)
+
+
+def _reward_3d(reward_matrix: np.ndarray, shape: Tuple[int, ...]) -> np.ndarray:
+    """Broadcasts a 1-D, 2-D or 3-D `reward_matrix` to `(state, action, next_state)`.
+
+    The result is a read-only view of `reward_matrix`.
+    """
+    extra_dims = (1,) * (len(shape) - reward_matrix.ndim)
+    return np.broadcast_to(
+        reward_matrix.reshape(reward_matrix.shape + extra_dims),
+        shape,
+    )
+
+
 class TabularModelMDP(ResettableMDP[int, int]):
     """Base class for tabular environments with known dynamics."""
 
@@ -174,41 +305,34 @@ class TabularModelMDP(ResettableMDP[int, int]):
             initial_state_dist: Distribution from which state is sampled at the
                 start of the episode.  If `None`, it is assumed initial state
                 is always 0.
-        """
-        n_states, n_actions, n_next_states = transition_matrix.shape
-        if n_states != n_next_states:
-            raise ValueError(
-                "Malformed transition_matrix:\n"
-                f"transition_matrix.shape: {transition_matrix.shape}\n"
-                f"{n_states} != {n_next_states}",
-            )
-
-        if initial_state_dist is None:
-            initial_state_dist = util.one_hot_encoding(0, n_states)
-        if initial_state_dist.ndim != 1:
-            raise ValueError(
-                "initial_state_dist has multiple dimensions:\n"
-                f"{initial_state_dist.ndim} != 1",
-            )
-        if initial_state_dist.shape[0] != n_states:
-            raise ValueError(
-                "transition_matrix and initial_state_dist are not compatible:\n"
-                f"n_states = {n_states}\n"
-                f"len(initial_state_dist) = {len(initial_state_dist)}",
-            )
 
-        if reward_matrix.shape != transition_matrix.shape[: len(reward_matrix.shape)]:
-            raise ValueError(
-                "transition_matrix and reward_matrix are not compatible:\n"
-                f"transition_matrix.shape: {transition_matrix.shape}\n"
-                f"reward_matrix.shape: {reward_matrix.shape}",
-            )
+        Sampling uses caches computed here, so `transition_matrix`, `reward_matrix`
+        and `initial_state_dist` must not be modified or reassigned after
+        construction.
+        """
+        initial_state_dist = _check_tabular_model(
+            transition_matrix,
+            reward_matrix,
+            initial_state_dist,
+        )
+        n_states, n_actions, _ = transition_matrix.shape
 
         self.transition_matrix = transition_matrix
         self.reward_matrix = reward_matrix
         self._feature_matrix = None
         self.horizon = horizon
         self.initial_state_dist = initial_state_dist
+        # Cache CDFs so sampling does not recompute the cumulative sum each step.
+        self._T_cdf = _cdf(transition_matrix)
+        self._init_cdf = _cdf(initial_state_dist)
+        self._R3 = _reward_3d(reward_matrix, transition_matrix.shape)
+        # The compiled kernel bypasses `transition` and `reward`, so only use it if
+        # neither is overridden.
+        cls = type(self)
+        self._fused_step = (
+            cls.transition is TabularModelMDP.transition
+            and cls.reward is TabularModelMDP.reward
+        )
 
         super().__init__(
             state_space=spaces.Discrete(n_states),
@@ -217,22 +341,26 @@ class TabularModelMDP(ResettableMDP[int, int]):
 
     def initial_state(self) -> int:
         """Samples from the initial state distribution."""
-        return util.sample_distribution(
-            self.initial_state_dist,
-            random=self.rand_state,
-        )
+        return util.sample_from_cdf(self._init_cdf, self.rng.random())
 
     def transition(self, state: int, action: int) -> int:
         """Samples from transition distribution."""
-        return util.sample_distribution(
-            self.transition_matrix[state, action],
-            random=self.rand_state,
-        )
+        return util.sample_from_cdf(self._T_cdf[state, action], self.rng.random())
 
     def reward(self, state: int, action: int, new_state: int) -> float:
         """Computes reward for a given transition."""
-        inputs = (state, action, new_state)[: len(self.reward_matrix.shape)]
-        return self.reward_matrix[inputs]
+        return self._R3[state, action, new_state]
+
+    def transition_reward(self, state: int, action: int) -> Tuple[int, float]:
+        """Samples next state and computes reward in a single compiled kernel.
+
+        Falls back to `transition` and `reward` if a subclass overrides either.
+        """
+        if not self._fused_step:
+            return super().transition_reward(state, action)
+        r = self.rng.random()
+        new_state, rew = _step_kernel(self._T_cdf, self._R3, state, action, r)
+        return new_state, float(rew)
 
     def terminal(self, state: int, n_actions_taken: int) -> bool:
         """Checks if state is terminal."""
@@ -246,3 +374,169 @@ class TabularModelMDP(ResettableMDP[int, int]):
             n_states = self.state_space.n
             self._feature_matrix = np.eye(n_states)
         return self._feature_matrix
+
+
+class TabularModelVecEnv(gym.vector.VectorEnv):
+    """Vectorized tabular environment with known dynamics.
+
+    Advances `num_envs` episodes of the same tabular MDP at once, sampling all
+    transitions with a single NumPy operation rather than one Python call per
+    environment. Episodes are reset automatically, as in Gym's `SyncVectorEnv`:
+    the step that ends an episode returns `done=True` for that environment, and
+    the observation it returns is already the first observation of the next
+    episode.
+
+    Rather than a list of `num_envs` info dicts, `step` returns a single dict of
+    arrays with the same keys as `TabularModelMDP`: `info["old_state"]` and
+    `info["new_state"]`. For environments that are done, `info["new_state"]` is
+    the final state of the episode, before resetting.
+
+    Note only the dynamics given by the matrices and `horizon` are used, so
+    subclasses of `TabularModelMDP` overriding `initial_state` or `terminal`
+    have no vectorized equivalent.
+    """
+
+    rand_buffer_size: int = 1 << 16
+    """Number of uniform random numbers to draw at once for sampling transitions."""
+
+    def __init__(
+        self,
+        *,
+        num_envs: int,
+        transition_matrix: np.ndarray,
+        reward_matrix: np.ndarray,
+        horizon: float = np.inf,
+        initial_state_dist: Optional[np.ndarray] = None,
+    ):
+        """Build vectorized tabular environment.
+
+        Args:
+            num_envs: Number of environments to step in parallel.
+            transition_matrix: 3-D array with transition probabilities for a
+                given state-action pair.
+            reward_matrix: 1-D, 2-D or 3-D array corresponding to rewards to a
+                given `(state, action, next_state)` triple, as in
+                `TabularModelMDP`.
+            horizon: Maximum number of timesteps, default `np.inf`.
+            initial_state_dist: Distribution from which state is sampled at the
+                start of the episode.  If `None`, it is assumed initial state
+                is always 0.
+
+        As in `TabularModelMDP`, the matrices are cached for sampling here and must
+        not be modified or reassigned after construction.
+        """
+        initial_state_dist = _check_tabular_model(
+            transition_matrix,
+            reward_matrix,
+            initial_state_dist,
+        )
+        n_states, n_actions, _ = transition_matrix.shape
+
+        self.transition_matrix = transition_matrix
+        self.reward_matrix = reward_matrix
+        self.horizon = horizon
+        self.initial_state_dist = initial_state_dist
+        self._T_cdf = _cdf(transition_matrix)
+        self._init_cdf = _cdf(initial_state_dist)
+        self._R3 = _reward_3d(reward_matrix, transition_matrix.shape)
+        self._flat_T_cdf: Optional[np.ndarray] = None
+
+        super().__init__(
+            num_envs=num_envs,
+            observation_space=spaces.Discrete(n_states),
+            action_space=spaces.Discrete(n_actions),
+        )
+
+        self.cur_state: Optional[np.ndarray] = None
+        self.steps: Optional[np.ndarray] = None
+        self._actions: Optional[np.ndarray] = None
+        self._rand_buf: Optional[np.ndarray] = None
+        self._rand_t = 0
+        self.seed()
+
+    def seed(self, seed=None) -> Sequence[int]:
+        """Set random seed, shared by all environments."""
+        if seed is None:
+            seed = np.random.randint(0, 1 << 31)
+        self.rng = np.random.default_rng(seed)
+        self._rand_buf = None
+        return [seed]
+
+    def _uniform(self) -> np.ndarray:
+        """Returns `num_envs` uniform random numbers, drawn from a prefetched buffer.
+
+        Filling the buffer for many steps at once amortizes the cost of calling
+        the random number generator.
+        """
+        if self._rand_buf is None or self._rand_t == self._rand_buf.shape[0]:
+            n_steps = max(1, self.rand_buffer_size // self.num_envs)
+            self._rand_buf = self.rng.random((n_steps, self.num_envs))
+            self._rand_t = 0
+        r = self._rand_buf[self._rand_t]
+        self._rand_t += 1
+        return r
+
+    def _initial_states(self, n: int) -> np.ndarray:
+        """Samples `n` states from the initial state distribution."""
+        return util.sample_from_cdf(self._init_cdf, self.rng.random(n))
+
+    def reset_wait(self, **kwargs) -> np.ndarray:
+        """Reset all environments and return initial observations."""
+        self._rand_buf = None
+        self.cur_state = self._initial_states(self.num_envs)
+        self.steps = np.zeros(self.num_envs, dtype=np.int64)
+        return self.cur_state.copy()
+
+    def step_async(self, actions) -> None:
+        """Store actions to take in each environment."""
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_envs,):
+            raise ValueError(
+                f"Expected {self.num_envs} actions, got shape {actions.shape}",
+            )
+        n_actions = self.single_action_space.n
+        is_int = np.issubdtype(actions.dtype, np.integer)
+        if not is_int or not np.all((0 <= actions) & (actions < n_actions)):
+            raise ValueError(f"{actions} not in {self.action_space}")
+        self._actions = actions
+
+    def step_wait(self, **kwargs) -> Tuple[np.ndarray, np.ndarray, np.ndarray, dict]:
+        """Transition all environments using actions from `step_async`."""
+        if self.cur_state is None or self.steps is None:
+            raise ValueError("Need to call reset() before first step()")
+        assert self._actions is not None
+
+        old_state = self.cur_state
+        actions = self._actions
+        r = self._uniform()
+        if numba is not None:
+            new_state, rews = _vec_step_kernel(
+                self._T_cdf,
+                self._R3,
+                old_state,
+                actions,
+                r,
+            )
+        else:
+            n_states, n_actions, _ = self._T_cdf.shape
+            if self._flat_T_cdf is None:
+                offsets = np.arange(n_states * n_actions).reshape(n_states, n_actions)
+                self._flat_T_cdf = (self._T_cdf + offsets[:, :, None]).ravel()
+            rows = old_state * n_actions + actions
+            new_state = _sample_from_cdf_rows(self._flat_T_cdf, n_states, rows, r)
+            rews = self._R3[old_state, actions, new_state].astype(np.float64)
+        dones = self.steps >= self.horizon
+        self.steps += 1
+
+        infos = {"old_state": old_state, "new_state": new_state}
+        n_done = dones.sum()
+        if n_done:
+            self.cur_state = new_state.copy()
+            self.cur_state[dones] = self._initial_states(n_done)
+            self.steps[dones] = 0
+        else:
+            self.cur_state = new_state
+        return self.cur_state.copy(), rews, dones, infos
+
+    def close_extras(self, **kwargs) -> None:
+        """No extra resources to release."""
@@ -1,13 +1,65 @@
 """Adaptation of classic Gym environments for specification learning algorithms."""
 
-import warnings
-
 from gym import spaces
 import gym.envs.classic_control
 import numpy as np
 
 from seals import util
 
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+
+def _cartpole_physics(
+    state: np.ndarray,
+    force,
+    gravity: float,
+    masspole: float,
+    total_mass: float,
+    length: float,
+    polemass_length: float,
+    tau: float,
+    euler: bool,
+) -> None:
+    """Advances CartPole `state` in place by one timestep.
+
+    This is the same integrator as `CartPoleEnv.step`, but operates on the last
+    axis of `state`, so it works both for a single state of shape `(4,)` and for a
+    batch of states of shape `(N, 4)` (with `force` of shape `(N,)`).
+    """
+    x, x_dot, theta, theta_dot = state.T
+    costheta = np.cos(theta)
+    sintheta = np.sin(theta)
+
+    # For the interested reader:
+    # https://coneural.org/florian/papers/05_cart_pole.pdf
+    temp = (force + polemass_length * theta_dot ** 2 * sintheta) / total_mass
+    thetaacc = (gravity * sintheta - costheta * temp) / (
+        length * (4.0 / 3.0 - masspole * costheta ** 2 / total_mass)
+    )
+    xacc = temp - polemass_length * thetaacc * costheta / total_mass
+
+    # All quantities above are computed before `state` is modified, and each
+    # component below only reads components not yet updated (Euler) or already
+    # updated (semi-implicit Euler), so updating in place is safe.
+    out = state.T
+    if euler:
+        out[0] = x + tau * x_dot
+        out[1] = x_dot + tau * xacc
+        out[2] = theta + tau * theta_dot
+        out[3] = theta_dot + tau * thetaacc
+    else:
+        out[1] = x_dot + tau * xacc
+        out[0] = x + tau * out[1]
+        out[3] = theta_dot + tau * thetaacc
+        out[2] = theta + tau * out[3]
+
+
+if numba is not None:
+    _cartpole_physics = numba.njit(cache=True)(_cartpole_physics)
+
 
 class FixedHorizonCartPole(gym.envs.classic_control.CartPoleEnv):
     """Fixed-length variant of CartPole-v1.
@@ -32,30 +84,53 @@ class FixedHorizonCartPole(gym.envs.classic_control.CartPoleEnv):
         high = np.array(high)
         self.observation_space = spaces.Box(-high, high, dtype=np.float32)
 
+        self._two_pi = 2 * np.pi
+
     def reset(self):
         """Reset for FixedHorizonCartPole."""
         return super().reset().astype(np.float32)
 
     def step(self, action):
         """Step function for FixedHorizonCartPole."""
-        with warnings.catch_warnings():
-            # Filter out CartPoleEnv warning for calling step() beyond done=True.
-            warnings.filterwarnings("ignore", ".*You are calling.*")
+        if self.state is None:
+            raise ValueError("Need to call reset() before first step()")
+        err_msg = f"{action!r} ({type(action)}) invalid"
+        assert self.action_space.contains(action), err_msg
+
+        state = self.state
+        if numba is None:
+            # Without Numba, Gym's scalar integrator is faster than NumPy on a single
+            # state. Clearing `steps_beyond_done` stops it warning about stepping
+            # beyond done=True, which this environment never returns.
+            self.steps_beyond_done = None
             super().step(action)
-
-        self.state = list(self.state)
-        x, _, theta, _ = self.state
-
+            state[:] = self.state
+            self.state = state
+        else:
+            _cartpole_physics(
+                state,
+                self.force_mag * (2 * action - 1),
+                self.gravity,
+                self.masspole,
+                self.total_mass,
+                self.length,
+                self.polemass_length,
+                self.tau,
+                self.kinematics_integrator == "euler",
+            )
+
+        # Work on Python floats: arithmetic on NumPy scalars costs far more here.
+        x, _, theta, _ = state.tolist()
         # Normalize theta to [-pi, pi] range.
-        theta = (theta + np.pi) % (2 * np.pi) - np.pi
-        self.state[2] = theta
+        theta = (theta + np.pi) % self._two_pi - np.pi
+        state[2] = theta
 
-        state_ok = bool(
-            abs(x) < self.x_threshold and abs(theta) < self.theta_threshold_radians,
+        # Reward is 1.0 if the state is ok, else 0.0: cast the comparisons directly
+        # rather than branching on them.
+        rew = float(
+            (abs(x) < self.x_threshold) & (abs(theta) < self.theta_threshold_radians),
         )
-
-        rew = 1.0 if state_ok else 0.0
-        return np.array(self.state, dtype=np.float32), rew, False, {}
+        return state.astype(np.float32), rew, False, {}
 
 
 def mountain_car():
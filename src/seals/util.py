@@ -1,10 +1,15 @@
 """Miscellaneous utilities."""
 
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 import gym
 import numpy as np
 
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
 
 class AutoResetWrapper(gym.Wrapper):
     """Hides done=True and auto-resets at the end of each episode."""
@@ -100,24 +105,19 @@ class AbsorbAfterDoneWrapper(gym.Wrapper):
         we return fixed values for obs, rew, done, and info. The values of `obs` and
         `rew` depend on initialization arguments. `info` is always an empty dictionary.
         """
-        if not self.at_absorb_state:
-            inner_obs, inner_rew, done, inner_info = self.env.step(action)
-            if done:
-                # Initialize the artificial absorb state, which we will repeatedly use
-                # starting on the next call to `step()`.
-                self.at_absorb_state = True
-
-                if self.absorb_obs_default is None:
-                    self.absorb_obs_this_episode = inner_obs
-                else:
-                    self.absorb_obs_this_episode = self.absorb_obs_default
-            obs, rew, info = inner_obs, inner_rew, inner_info
-        else:
-            assert self.absorb_obs_this_episode is not None
-            assert self.absorb_reward is not None
-            obs = self.absorb_obs_this_episode
-            rew = self.absorb_reward
-            info = {}
+        if self.at_absorb_state:
+            return self.absorb_obs_this_episode, self.absorb_reward, False, {}
+
+        obs, rew, done, info = self.env.step(action)
+        if done:
+            # Initialize the artificial absorb state, which we will repeatedly use
+            # starting on the next call to `step()`.
+            self.at_absorb_state = True
+
+            if self.absorb_obs_default is None:
+                self.absorb_obs_this_episode = obs
+            else:
+                self.absorb_obs_this_episode = self.absorb_obs_default
 
         return obs, rew, False, info
 
@@ -135,14 +135,36 @@ def get_gym_max_episode_steps(env_name: str) -> Optional[int]:
     return gym.envs.registry.env_specs[env_name].max_episode_steps
 
 
+def sample_from_cdf(cdf: np.ndarray, r):
+    """Samples integers from a distribution given its cumulative sum `cdf`.
+
+    Args:
+        cdf: 1-D array, the cumulative sum of the probabilities. The final entry
+            must be exactly 1, so that every `r` falls within the distribution.
+        r: Uniform random number in `[0, 1)`, or an array of them.
+
+    Returns:
+        For each `r`, the smallest `i` such that `r < cdf[i]`. JIT-compiled if
+        Numba is installed.
+    """
+    return np.searchsorted(cdf, r, side="right")
+
+
+if numba is not None:
+    sample_from_cdf = numba.njit(cache=True)(sample_from_cdf)
+
+
 def sample_distribution(
     p: np.ndarray,
-    random: Optional[np.random.RandomState] = None,
+    random: Optional[Union[np.random.RandomState, np.random.Generator]] = None,
 ) -> int:
     """Samples an integer with probabilities given by p."""
     if random is None:
         random = np.random
-    return random.choice(np.arange(len(p)), p=p)
+    cdf = np.cumsum(p)
+    # Guard against rounding error leaving the final entry just below 1.
+    cdf[-1] = 1.0
+    return sample_from_cdf(cdf, random.random())
 
 
 def one_hot_encoding(pos: int, size: int) -> np.ndarray:
@@ -0,0 +1,49 @@
+"""Vectorized environments running copies of a seals environment in parallel."""
+
+import functools
+
+import gym
+import gym.vector
+
+
+def _make_env(env_name: str, **kwargs) -> gym.Env:
+    """Builds `env_name`.
+
+    Defined at module level so it pickles by reference: unpickling it in a
+    subprocess imports `seals`, registering the seals environments even when
+    subprocesses are spawned rather than forked.
+    """
+    return gym.make(env_name, **kwargs)
+
+
+def make(
+    env_name: str,
+    n_envs: int,
+    asynchronous: bool = True,
+    **kwargs,
+) -> gym.vector.VectorEnv:
+    """Builds a vectorized environment of `n_envs` copies of `env_name`.
+
+    Environments such as `seals/CartPole-v0` step with Python physics, so running
+    copies in subprocesses is the main way to use several cores for them. Each step
+    still pays for interprocess communication, so with few cores, or with cheap
+    environments, `asynchronous=False` is often faster.
+
+    Args:
+        env_name: The ID of a registered Gym environment, e.g. `seals/CartPole-v0`.
+        n_envs: Number of copies of the environment.
+        asynchronous: If True, run each copy in its own subprocess using
+            `gym.vector.AsyncVectorEnv`, with observations returned through shared
+            memory rather than pickled. If False, step all copies in this process
+            using `gym.vector.SyncVectorEnv`.
+        **kwargs: Passed through to `gym.make`.
+
+    Returns:
+        The vectorized environment. Its `step` sends a single batch of `n_envs`
+        actions to the copies, and episodes are automatically reset at their end.
+    """
+    env_fns = [functools.partial(_make_env, env_name, **kwargs) for _ in range(n_envs)]
+    if asynchronous:
+        return gym.vector.AsyncVectorEnv(env_fns, shared_memory=True)
+    else:
+        return gym.vector.SyncVectorEnv(env_fns)
@@ -4,10 +4,13 @@ Note base_envs is also tested indirectly via smoke tests in `test_envs`,
 so the tests in this file focus on features unique to classes in `base_envs`.
 """
 
+import subprocess
+import sys
+
 import numpy as np
 import pytest
 
-from seals import base_envs
+from seals import base_envs, util
 from seals.testing import envs
 
 
@@ -72,3 +75,201 @@ def test_tabular_env_validation():
     env.reset()
     with pytest.raises(ValueError, match=r".*not in.*"):
         env.step(4)
+
+
+def test_tabular_vec_env():
+    """Test base_envs.TabularModelVecEnv."""
+    nS, nA, num_envs, horizon = 4, 2, 16, 3
+    transition_matrix = np.random.rand(nS, nA, nS)
+    transition_matrix /= transition_matrix.sum(axis=2)[:, :, None]
+    reward_matrix = np.random.rand(nS, nA)
+    env = base_envs.TabularModelVecEnv(
+        num_envs=num_envs,
+        transition_matrix=transition_matrix,
+        reward_matrix=reward_matrix,
+        horizon=horizon,
+    )
+
+    with pytest.raises(ValueError, match=r"Need to call reset.*"):
+        env.step(np.zeros(num_envs, dtype=int))
+
+    env.seed(0)
+    obs = env.reset()
+    assert obs.shape == (num_envs,)
+    assert np.all(obs == 0)
+
+    with pytest.raises(ValueError, match=r".*not in.*"):
+        env.step(np.full(num_envs, nA))
+    with pytest.raises(ValueError, match=r".*not in.*"):
+        env.step(np.zeros(num_envs, dtype=float))
+
+    for t in range(1, 3 * (horizon + 1)):
+        old_obs = obs
+        acts = np.random.randint(nA, size=num_envs)
+        obs, rews, dones, infos = env.step(acts)
+        assert obs in env.observation_space
+        np.testing.assert_array_equal(infos["old_state"], old_obs)
+        np.testing.assert_array_equal(rews, reward_matrix[old_obs, acts])
+        # Episodes are synchronized, since all start together and have same horizon.
+        assert np.all(dones == (t % (horizon + 1) == 0))
+        if dones[0]:
+            assert np.all(obs == 0)
+        else:
+            np.testing.assert_array_equal(infos["new_state"], obs)
+
+    # Sampled transitions match the empirical transition distribution.
+    n_samples = 2000
+    env = base_envs.TabularModelVecEnv(
+        num_envs=n_samples,
+        transition_matrix=transition_matrix,
+        reward_matrix=reward_matrix,
+    )
+    env.reset()
+    obs, _, _, _ = env.step(np.ones(n_samples, dtype=int))
+    empirical_distr = np.bincount(obs, minlength=nS) / n_samples
+    assert np.sum(np.abs(empirical_distr - transition_matrix[0, 1])) < 0.1
+
+
+def test_tabular_sampling():
+    """Test TabularModelMDP samples from the cached CDFs correctly."""
+    nS = 4
+    transition_matrix = np.zeros((nS, 1, nS))
+    # Zero-probability states at either end must never be sampled.
+    transition_matrix[:, 0, :] = [0.0, 0.25, 0.75, 0.0]
+    env = base_envs.TabularModelMDP(
+        transition_matrix=transition_matrix,
+        reward_matrix=np.zeros((nS,)),
+        initial_state_dist=np.array([0.0, 0.0, 0.0, 1.0]),
+    )
+    env.seed(0)
+
+    n_samples = 2000
+    assert all(env.initial_state() == 3 for _ in range(100))
+    samples = [env.transition(0, 0) for _ in range(n_samples)]
+    empirical_distr = np.bincount(samples, minlength=nS) / n_samples
+    assert empirical_distr[0] == empirical_distr[3] == 0.0
+    assert np.sum(np.abs(empirical_distr - transition_matrix[0, 0])) < 0.1
+
+
+def test_sample_from_cdf_rows():
+    """Test batched sampling agrees with sampling each row separately."""
+    n_rows, n = 6, 5
+    probs = np.random.rand(n_rows, n)
+    probs[:, [0, 2]] = 0.0  # zero-probability states must never be sampled
+    probs /= probs.sum(axis=1, keepdims=True)
+    cdf = base_envs._cdf(probs)
+    flat_cdf = (cdf + np.arange(n_rows)[:, None]).ravel()
+
+    rows = np.random.randint(n_rows, size=1000)
+    r = np.random.rand(1000)
+    samples = base_envs._sample_from_cdf_rows(flat_cdf, n, rows, r)
+    expected = [util.sample_from_cdf(cdf[row], x) for row, x in zip(rows, r)]
+    np.testing.assert_array_equal(samples, expected)
+    assert not np.isin(samples, [0, 2]).any()
+
+
+def _random_tabular_model(n_states: int = 5, n_actions: int = 3):
+    """Random transition and 3-D reward matrices for a tabular environment."""
+    transition_matrix = np.random.rand(n_states, n_actions, n_states)
+    transition_matrix /= transition_matrix.sum(axis=2)[:, :, None]
+    reward_matrix = np.random.rand(n_states, n_actions, n_states)
+    return dict(transition_matrix=transition_matrix, reward_matrix=reward_matrix)
+
+
+@pytest.mark.parametrize("reward_ndim", [1, 2, 3])
+def test_tabular_reward(reward_ndim: int):
+    """Test `reward` indexes reward matrices of each dimension by a prefix."""
+    model = _random_tabular_model()
+    # Keep the leading `reward_ndim` axes of a random 3-D reward matrix.
+    reward_matrix = model["reward_matrix"][(...,) + (0,) * (3 - reward_ndim)]
+    env = base_envs.TabularModelMDP(
+        transition_matrix=model["transition_matrix"],
+        reward_matrix=reward_matrix,
+    )
+    for state, action, new_state in np.ndindex(*model["transition_matrix"].shape):
+        inputs = (state, action, new_state)[:reward_ndim]
+        assert env.reward(state, action, new_state) == reward_matrix[inputs]
+
+
+def test_step_kernel_matches_transition_reward():
+    """Test the fused step agrees with calling `transition` then `reward`."""
+
+    class OverrideEnv(base_envs.TabularModelMDP):
+        n_transitions = 0
+
+        def transition(self, state: int, action: int) -> int:
+            self.n_transitions += 1
+            return super().transition(state, action)
+
+    model = _random_tabular_model()
+    fused_env = base_envs.TabularModelMDP(**model)
+    override_env = OverrideEnv(**model)
+    assert fused_env._fused_step
+    assert not override_env._fused_step
+
+    actions = np.random.randint(3, size=100)
+    rollouts = []
+    for env in [fused_env, override_env]:
+        env.seed(0)
+        rollouts.append(envs.get_rollout(env, actions))
+    envs.assert_equal_rollout(*rollouts)
+    # Overriding `transition` makes `step` fall back to calling it.
+    assert override_env.n_transitions == len(actions)
+
+    # Compiled and pure Python kernels agree.
+    cdf, rew = fused_env._T_cdf, fused_env._R3
+    states = np.random.randint(5, size=100)
+    r = np.random.rand(100)
+    vec_kernel = base_envs._vec_step_kernel
+    expected = getattr(vec_kernel, "py_func", vec_kernel)(cdf, rew, states, actions, r)
+    np.testing.assert_array_equal(vec_kernel(cdf, rew, states, actions, r), expected)
+    for i in range(len(states)):
+        res = base_envs._step_kernel(cdf, rew, states[i], actions[i], r[i])
+        assert res == (expected[0][i], expected[1][i])
+
+
+def test_tabular_vec_env_without_numba(monkeypatch):
+    """Test the pure NumPy path of TabularModelVecEnv matches the Numba path."""
+    num_envs = 50
+    model = _random_tabular_model()
+    vec_envs = [
+        base_envs.TabularModelVecEnv(num_envs=num_envs, horizon=4, **model)
+        for _ in range(2)
+    ]
+    for env in vec_envs:
+        env.seed(0)
+        env.reset()
+
+    for _ in range(20):
+        acts = np.random.randint(3, size=num_envs)
+        step_a = vec_envs[0].step(acts)
+        with monkeypatch.context() as m:
+            m.setattr(base_envs, "numba", None)
+            step_b = vec_envs[1].step(acts)
+        for a, b in zip(step_a, step_b):
+            np.testing.assert_equal(a, b)
+
+
+def test_tabular_vec_env_fork():
+    """Test the process exits after stepping TabularModelVecEnv and then forking.
+
+    Run in a subprocess, since a hang on exit would otherwise hang the test suite.
+    """
+    script = """
+import multiprocessing
+import numpy as np
+from seals import base_envs
+
+env = base_envs.TabularModelVecEnv(
+    num_envs=8,
+    transition_matrix=np.full((3, 2, 3), 1 / 3),
+    reward_matrix=np.zeros(3),
+)
+env.reset()
+env.step(np.zeros(8, dtype=int))
+proc = multiprocessing.get_context("fork").Process(target=int)
+proc.start()
+proc.join()
+assert proc.exitcode == 0
+"""
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=120)
@@ -0,0 +1,66 @@
+"""Test `seals.classic_control`."""
+
+import gym.envs.classic_control
+import numpy as np
+import pytest
+
+from seals import classic_control
+
+
+@pytest.mark.parametrize("integrator", ["euler", "semi-implicit euler"])
+def test_cartpole_physics(integrator: str, n_envs: int = 3, n_steps: int = 500):
+    """Check `_cartpole_physics` matches `CartPoleEnv.step` on a batch of states.
+
+    Compiled by Numba, it matches exactly. Without Numba, NumPy's vectorized
+    `sin` and `cos` may differ from Gym's `math.sin` and `math.cos` in the last
+    bit, so only each single step is compared, up to rounding error.
+    """
+    gym_envs = []
+    for i in range(n_envs):
+        env = gym.envs.classic_control.CartPoleEnv()
+        env.kinematics_integrator = integrator
+        env.seed(i)
+        env.reset()
+        gym_envs.append(env)
+
+    rng = np.random.RandomState(0)
+    for _ in range(n_steps):
+        states = np.array([env.state for env in gym_envs])
+        actions = rng.randint(2, size=n_envs)
+        for env, action in zip(gym_envs, actions):
+            env.steps_beyond_done = None  # suppress warning about stepping after done
+            env.step(action)
+        env = gym_envs[0]
+        classic_control._cartpole_physics(
+            states,
+            env.force_mag * (2 * actions - 1),
+            env.gravity,
+            env.masspole,
+            env.total_mass,
+            env.length,
+            env.polemass_length,
+            env.tau,
+            integrator == "euler",
+        )
+        expected = np.array([env.state for env in gym_envs])
+        if classic_control.numba is None:
+            np.testing.assert_allclose(states, expected, rtol=1e-12, atol=1e-12)
+        else:
+            np.testing.assert_array_equal(states, expected)
+
+
+def test_cartpole_without_numba(monkeypatch, n_steps: int = 500):
+    """Check FixedHorizonCartPole gives the same rollout with and without Numba."""
+    rollouts = []
+    for numba in [classic_control.numba, None]:
+        monkeypatch.setattr(classic_control, "numba", numba)
+        env = classic_control.FixedHorizonCartPole()
+        env.seed(0)
+        rollout = [env.reset()]
+        rng = np.random.RandomState(0)
+        for _ in range(n_steps):
+            obs, rew, done, _ = env.step(rng.randint(2))
+            assert done is False
+            rollout.append((obs, rew))
+        rollouts.append(rollout)
+    np.testing.assert_equal(*rollouts)
@@ -0,0 +1,46 @@
+"""Test `seals.vector`."""
+
+import numpy as np
+import pytest
+
+from seals import vector
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_make(asynchronous: bool, n_envs: int = 3, n_steps: int = 10):
+    """Check vectorized environments have batched spaces and step all copies."""
+    env = vector.make("seals/CartPole-v0", n_envs, asynchronous=asynchronous)
+    try:
+        env.seed(0)
+        obs = env.reset()
+        assert obs.shape == (n_envs, 4)
+        assert obs.dtype == np.float32
+        for _ in range(n_steps):
+            obs, rews, dones, infos = env.step(env.action_space.sample())
+            assert obs.shape == (n_envs, 4)
+            assert rews.shape == dones.shape == (n_envs,)
+            assert len(infos) == n_envs
+    finally:
+        env.close()
+
+
+def test_make_async_matches_sync(n_envs: int = 3, n_steps: int = 20):
+    """Check subprocess copies step identically to in-process copies."""
+    rng = np.random.default_rng(0)
+    actions = rng.integers(0, 2, size=(n_steps, n_envs))
+    trajs = []
+    for asynchronous in [False, True]:
+        env = vector.make("seals/CartPole-v0", n_envs, asynchronous=asynchronous)
+        try:
+            env.seed(0)
+            traj = [env.reset()]
+            for act in actions:
+                obs, rews, _, _ = env.step(act)
+                traj.extend([obs, rews])
+        finally:
+            env.close()
+        trajs.append(traj)
+
+    sync_traj, async_traj = trajs
+    for sync_arr, async_arr in zip(sync_traj, async_traj):
+        np.testing.assert_array_equal(sync_arr, async_arr)
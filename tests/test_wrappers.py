@@ -86,6 +86,24 @@ def test_absorb_repeat_final_state(episode_length=6, n_steps=100, n_manual_reset
             assert rew == expected_rew
 
 
+def test_absorb_fresh_info(episode_length=3, n_steps=10):
+    """Check AbsorbAfterDoneWrapper returns a new info dict on each absorbed step.
+
+    Outer wrappers such as `TimeLimit` write into `info`, which must not leak
+    into the info of other steps.
+    """
+    env = envs.CountingEnv(episode_length=episode_length)
+    env = util.AbsorbAfterDoneWrapper(env)
+    env.reset()
+    infos = []
+    for _ in range(n_steps):
+        _, _, _, info = env.step(env.action_space.sample())
+        assert info == {}
+        info["mutated"] = True
+        infos.append(info)
+    assert len({id(info) for info in infos}) == n_steps
+
+
 @pytest.mark.parametrize("dtype", [np.int, np.float32, np.float64])
 def test_obs_cast(dtype: np.dtype, episode_length: int = 5):
     """Check obs_cast observations are of specified dtype and not mangled.